@@ -3,16 +3,176 @@ AI logic for Reversi/Othello game
 """
 
 import random
-from typing import Optional, Tuple, List
-from board import Board
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple, List
+from board import Board, UndoInfo, popcount
 from config import PLAYER_BLACK
 
+# Transposition table bound types
+EXACT = 0
+LOWER = 1  # Score is at least the stored value (beta cutoff)
+UPPER = 2  # Score is at most the stored value (no move raised alpha)
+
+# Number of transposition table slots (a power of two)
+TT_SIZE = 1 << 16
+
+# Mixed into the Zobrist key of maximizing nodes, since the same position
+# can be reached as both a maximizing and a minimizing node
+_MAXIMIZING_KEY = random.Random(1).getrandbits(64)
+
+# A transposition table entry: (key, depth, score, bound, best move, age)
+TTEntry = Tuple[int, int, float, int, Optional[Tuple[int, int]], int]
+
+# Search root moves in worker processes only when there are at least this
+# many of them; below that, process start-up costs more than it saves
+PARALLEL_MIN_MOVES = 4
+
+# Per board size: weight of each square, indexed by row * size + col
+_WEIGHT_CACHE: Dict[int, Tuple[int, ...]] = {}
+
+# Per board size: (weight, mask of squares with that weight) pairs
+_WEIGHT_MASK_CACHE: Dict[int, Tuple[Tuple[int, int], ...]] = {}
+
+# Per board size: (corner mask, edge mask excluding corners)
+_REGION_CACHE: Dict[int, Tuple[int, int]] = {}
+
+# Per board size: mask of the 3x3 block the simple heuristic prefers
+_CENTER_CACHE: Dict[int, int] = {}
+
+# Per board size: simple heuristic score of each square
+_SIMPLE_SCORE_CACHE: Dict[int, Tuple[int, ...]] = {}
+
+
+def _position_weights(size: int) -> Tuple[int, ...]:
+    """Get the flat position weight table for a board size"""
+    weights = _WEIGHT_CACHE.get(size)
+    if weights is None:
+        # Position values (corners highest, edges medium, center low)
+        last = size - 1
+        values = []
+        for row in range(size):
+            for col in range(size):
+                on_row_edge = row in (0, last)
+                on_col_edge = col in (0, last)
+                if on_row_edge and on_col_edge:
+                    values.append(100)
+                elif on_row_edge or on_col_edge:
+                    values.append(10)
+                else:
+                    values.append(0)
+        weights = tuple(values)
+        _WEIGHT_CACHE[size] = weights
+    return weights
+
+
+def _weight_masks(size: int) -> Tuple[Tuple[int, int], ...]:
+    """Group the squares of a board size by non-zero position weight.
+
+    The weight table only has a few distinct values, so the positional
+    value becomes one popcount per weight instead of a sum over pieces.
+    """
+    masks = _WEIGHT_MASK_CACHE.get(size)
+    if masks is None:
+        by_weight: Dict[int, int] = {}
+        for index, weight in enumerate(_position_weights(size)):
+            if weight:
+                by_weight[weight] = by_weight.get(weight, 0) | (1 << index)
+        masks = tuple(sorted(by_weight.items(), reverse=True))
+        _WEIGHT_MASK_CACHE[size] = masks
+    return masks
+
+
+def _region_masks(size: int) -> Tuple[int, int]:
+    """Get the corner and edge bitboard masks for a board size"""
+    masks = _REGION_CACHE.get(size)
+    if masks is None:
+        last = size - 1
+        corners = edges = 0
+        for row in range(size):
+            for col in range(size):
+                bit = 1 << (row * size + col)
+                on_row_edge = row in (0, last)
+                on_col_edge = col in (0, last)
+                if on_row_edge and on_col_edge:
+                    corners |= bit
+                elif on_row_edge or on_col_edge:
+                    edges |= bit
+        masks = (corners, edges)
+        _REGION_CACHE[size] = masks
+    return masks
+
+
+def _center_mask(size: int) -> int:
+    """Get the center region mask for a board size"""
+    mask = _CENTER_CACHE.get(size)
+    if mask is None:
+        lines = range(max(0, size // 2 - 1), min(size, size // 2 + 2))
+        mask = 0
+        for row in lines:
+            for col in lines:
+                mask |= 1 << (row * size + col)
+        _CENTER_CACHE[size] = mask
+    return mask
+
+
+def _simple_move_scores(size: int) -> Tuple[int, ...]:
+    """Get the simple heuristic score of every square on a board size.
+
+    The score only depends on where a move is, so it is worked out once
+    per board size: corners beat edges, and edges beat the center.
+    """
+    scores = _SIMPLE_SCORE_CACHE.get(size)
+    if scores is None:
+        corners, edges = _region_masks(size)
+        center = _center_mask(size)
+        table = []
+        for index in range(size * size):
+            bit = 1 << index
+            score = 1  # Base score
+            if bit & corners:
+                score += 10
+            elif bit & edges:
+                score += 3
+            elif bit & center:
+                score += 2  # Center preference
+            table.append(score)
+        scores = tuple(table)
+        _SIMPLE_SCORE_CACHE[size] = scores
+    return scores
+
+
+def _search_root_move(job: Tuple[int, int, UndoInfo, Tuple[int, int], int]) -> float:
+    """Score one root move with a full-window search (worker process entry)"""
+    difficulty, size, state, move, depth = job
+    board = Board(size)
+    board.revert(state)
+    board.make_move(move[0], move[1], board.current_player)
+    board.switch_player()
+    ai = AI(difficulty)
+    return ai._minimax_alpha_beta(board, depth - 1, False, -float("inf"), float("inf"))
+
 
 class AI:
     """Simple AI for the game"""
 
-    def __init__(self, difficulty: int = 1):
+    def __init__(
+        self,
+        difficulty: int = 1,
+        workers: int = 1,
+        time_limit: Optional[float] = None,
+    ):
         self.difficulty = difficulty  # 1-3, higher is better
+        self.workers = workers  # Processes for root search, 1 runs serially
+        self.time_limit = time_limit  # Seconds before search stops deepening
+        # Slot key & (TT_SIZE - 1) holds at most one entry; the age is bumped
+        # once per move so entries from earlier moves can be replaced
+        self.transposition_table: List[Optional[TTEntry]] = [None] * TT_SIZE
+        self.tt_age = 0
+        # Move ordering: up to two moves per remaining depth that caused a
+        # cutoff (killers), and a score per (player, move) raised on cutoffs
+        self.killers: Dict[int, List[Tuple[int, int]]] = {}
+        self.history_scores: Dict[Tuple[int, Tuple[int, int]], int] = {}
 
     def get_move(self, board: Board) -> Optional[Tuple[int, int]]:
         """Get AI move"""
@@ -35,61 +195,66 @@ class AI:
     ) -> Tuple[int, int]:
         """Simple heuristic: prefer corners, then edges, then center"""
         size = board.size
-        corners = [(0, 0), (0, size - 1), (size - 1, 0), (size - 1, size - 1)]
-        edges = []
+        scores = _simple_move_scores(size)
 
-        # Add edge positions (excluding corners)
-        for i in range(1, size - 1):
-            edges.extend([(0, i), (size - 1, i), (i, 0), (i, size - 1)])
+        # First move with the best score wins
+        return max(valid_moves, key=lambda move: scores[move[0] * size + move[1]])
 
-        # Score moves
-        best_move = None
-        best_score = -1
+    def _get_best_move_minimax(
+        self, board: Board, valid_moves: List[Tuple[int, int]]
+    ) -> Tuple[int, int]:
+        """Enhanced minimax with alpha-beta pruning and better evaluation.
 
-        for move in valid_moves:
-            score = 1  # Base score
+        Searches with iterative deepening: each pass searches the previous
+        pass's best move first, and the transposition table carries best
+        moves down to inner nodes, so the deepest pass prunes harder. If
+        time_limit is set, no new pass starts once it has run out.
+        """
+        # Use deeper search for expert level
+        depth = 4 if self.difficulty == 3 else 2
 
-            if move in corners:
-                score += 10
-            elif move in edges:
-                score += 3
-            else:
-                # Center preference
-                row, col = move
-                center_start = size // 2 - 1
-                center_end = size // 2 + 1
-                if (
-                    center_start <= row <= center_end
-                    and center_start <= col <= center_end
-                ):
-                    score += 2
+        if self.workers > 1 and len(valid_moves) >= PARALLEL_MIN_MOVES:
+            return self._get_best_move_parallel(board, valid_moves, depth)
 
-            if score > best_score:
-                best_score = score
-                best_move = move
+        self.tt_age += 1
+        self.killers.clear()
+        self.history_scores.clear()
+        start_time = time.monotonic()
+        moves = list(valid_moves)
+        best_move = moves[0]
+        for current_depth in range(1, depth + 1):
+            best_move = self._search_root(board, moves, current_depth)
+
+            # Search the best move first on the next pass
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+
+            if (
+                self.time_limit is not None
+                and time.monotonic() - start_time >= self.time_limit
+            ):
+                break
 
         return best_move
 
-    def _get_best_move_minimax(
-        self, board: Board, valid_moves: List[Tuple[int, int]]
+    def _search_root(
+        self, board: Board, moves: List[Tuple[int, int]], depth: int
     ) -> Tuple[int, int]:
-        """Enhanced minimax with alpha-beta pruning and better evaluation"""
+        """Search the root moves in order to a fixed depth"""
         best_move = None
         best_score = -float("inf")
         alpha = -float("inf")
         beta = float("inf")
 
-        # Use deeper search for expert level
-        depth = 4 if self.difficulty == 3 else 2
-
-        for move in valid_moves:
+        player = board.current_player
+        for move in moves:
             # Try the move
-            board_copy = self._copy_board(board)
-            board_copy.make_move(move[0], move[1], board.current_player)
-            board_copy.switch_player()
+            undo = board.apply(move[0], move[1], player)
+            board.switch_player()
 
             # Evaluate with alpha-beta pruning
-            score = self._minimax_alpha_beta(board_copy, depth - 1, False, alpha, beta)
+            score = self._minimax_alpha_beta(board, depth - 1, False, alpha, beta)
+            board.revert(undo)
 
             if score > best_score:
                 best_score = score
@@ -99,51 +264,157 @@ class AI:
 
         return best_move
 
+    def _get_best_move_parallel(
+        self, board: Board, valid_moves: List[Tuple[int, int]], depth: int
+    ) -> Tuple[int, int]:
+        """Search each root move in its own worker process.
+
+        Workers share no alpha bound or transposition table, so each root
+        move gets a full-window search; the first move with the best score
+        wins, matching the serial search.
+        """
+        state = board.snapshot()
+        jobs = [
+            (self.difficulty, board.size, state, move, depth) for move in valid_moves
+        ]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            scores = list(pool.map(_search_root_move, jobs))
+
+        best_index = max(range(len(scores)), key=scores.__getitem__)
+        return valid_moves[best_index]
+
     def _minimax_alpha_beta(
         self, board: Board, depth: int, maximizing: bool, alpha: float, beta: float
     ) -> int:
-        """Minimax with alpha-beta pruning"""
-        if depth == 0 or board.check_game_over():
+        """Minimax with alpha-beta pruning and a transposition table"""
+        if depth == 0:
             return self._evaluate_board_advanced(board)
 
-        valid_moves = board.get_valid_moves(board.current_player)
+        key = board.hash_key()
+        if maximizing:
+            key ^= _MAXIMIZING_KEY
+
+        table = self.transposition_table
+        slot = key & (TT_SIZE - 1)
+        entry = table[slot]
+        if entry is not None and entry[0] != key:
+            entry = None  # Slot holds a different position
+        tt_move = None
+        if entry is not None:
+            tt_move = entry[4]
+        if entry is not None and entry[1] >= depth:
+            _, _, score, bound, _, _ = entry
+            if bound == EXACT:
+                return score
+            if bound == LOWER:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if beta <= alpha:
+                return score
+
+        if board.check_game_over():
+            return self._evaluate_board_advanced(board)
+
+        player = board.current_player
+        valid_moves = board.get_valid_moves(player)
 
         if not valid_moves:
             # No moves available, pass turn
-            board_copy = self._copy_board(board)
-            board_copy.switch_player()
-            return self._minimax_alpha_beta(
-                board_copy, depth - 1, not maximizing, alpha, beta
+            undo = board.snapshot()
+            board.switch_player()
+            score = self._minimax_alpha_beta(
+                board, depth - 1, not maximizing, alpha, beta
             )
+            board.revert(undo)
+            return score
+
+        # Order moves by history score, then put the killer moves and the
+        # best move from an earlier search in front
+        history = self.history_scores
+        if history:
+            valid_moves.sort(
+                key=lambda move: history.get((player, move), 0), reverse=True
+            )
+        for move in (*reversed(self.killers.get(depth, ())), tt_move):
+            if move is not None and move in valid_moves:
+                valid_moves.remove(move)
+                valid_moves.insert(0, move)
+
+        original_alpha, original_beta = alpha, beta
+        best_move = None
+        # Children of a depth 1 node are leaves: evaluate them directly
+        # rather than through a recursive call that only evaluates
+        leaf = depth == 1
 
         if maximizing:
-            max_eval = -float("inf")
+            best_eval = -float("inf")
             for move in valid_moves:
-                board_copy = self._copy_board(board)
-                board_copy.make_move(move[0], move[1], board.current_player)
-                board_copy.switch_player()
-                eval_score = self._minimax_alpha_beta(
-                    board_copy, depth - 1, False, alpha, beta
-                )
-                max_eval = max(max_eval, eval_score)
+                undo = board.apply(move[0], move[1], player)
+                board.switch_player()
+                if leaf:
+                    eval_score = self._evaluate_board_advanced(board)
+                else:
+                    eval_score = self._minimax_alpha_beta(
+                        board, depth - 1, False, alpha, beta
+                    )
+                board.revert(undo)
+                if eval_score > best_eval:
+                    best_eval = eval_score
+                    best_move = move
                 alpha = max(alpha, eval_score)
                 if beta <= alpha:
+                    self._record_cutoff(player, move, depth)
                     break  # Beta cutoff
-            return max_eval
         else:
-            min_eval = float("inf")
+            best_eval = float("inf")
             for move in valid_moves:
-                board_copy = self._copy_board(board)
-                board_copy.make_move(move[0], move[1], board.current_player)
-                board_copy.switch_player()
-                eval_score = self._minimax_alpha_beta(
-                    board_copy, depth - 1, True, alpha, beta
-                )
-                min_eval = min(min_eval, eval_score)
+                undo = board.apply(move[0], move[1], player)
+                board.switch_player()
+                if leaf:
+                    eval_score = self._evaluate_board_advanced(board)
+                else:
+                    eval_score = self._minimax_alpha_beta(
+                        board, depth - 1, True, alpha, beta
+                    )
+                board.revert(undo)
+                if eval_score < best_eval:
+                    best_eval = eval_score
+                    best_move = move
                 beta = min(beta, eval_score)
                 if beta <= alpha:
+                    self._record_cutoff(player, move, depth)
                     break  # Alpha cutoff
-            return min_eval
+
+        if best_eval <= original_alpha:
+            bound = UPPER
+        elif best_eval >= original_beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+
+        # Depth-preferred replacement: keep deeper entries from this move
+        existing = table[slot]
+        if existing is None or depth >= existing[1] or existing[5] != self.tt_age:
+            table[slot] = (
+                key,
+                depth,
+                best_eval,
+                bound,
+                best_move,
+                self.tt_age,
+            )
+
+        return best_eval
+
+    def _record_cutoff(self, player: int, move: Tuple[int, int], depth: int):
+        """Remember a move that caused a cutoff for ordering later searches"""
+        killers = self.killers.setdefault(depth, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+        key = (player, move)
+        self.history_scores[key] = self.history_scores.get(key, 0) + depth * depth
 
     def _evaluate_board_advanced(self, board: Board) -> int:
         """Advanced board evaluation with positional values and mobility"""
@@ -171,8 +442,8 @@ class AI:
         ) - self._calculate_positional_value(board, opponent)
 
         # Mobility (number of valid moves)
-        current_mobility = len(board.get_valid_moves(current_player))
-        opponent_mobility = len(board.get_valid_moves(opponent))
+        current_mobility = board.count_valid_moves(current_player)
+        opponent_mobility = board.count_valid_moves(opponent)
         mobility_value = 10 * (current_mobility - opponent_mobility)
 
         # Corner control bonus
@@ -197,71 +468,19 @@ class AI:
 
     def _calculate_positional_value(self, board: Board, player: int) -> int:
         """Calculate positional value for a player"""
-        size = board.size
-        value = 0
-
-        # Position values (corners highest, edges medium, center low)
-        position_weights = [[0] * size for _ in range(size)]
-
-        # Corners
-        position_weights[0][0] = 100
-        position_weights[0][size - 1] = 100
-        position_weights[size - 1][0] = 100
-        position_weights[size - 1][size - 1] = 100
-
-        # Edges (excluding corners)
-        for i in range(1, size - 1):
-            position_weights[0][i] = 10
-            position_weights[size - 1][i] = 10
-            position_weights[i][0] = 10
-            position_weights[i][size - 1] = 10
-
         # Count pieces in valuable positions
-        for row in range(size):
-            for col in range(size):
-                if board.grid[row][col] == player:
-                    value += position_weights[row][col]
-
-        return value
+        pieces = board.bitboard(player)
+        return sum(
+            weight * popcount(pieces & mask)
+            for weight, mask in _weight_masks(board.size)
+        )
 
     def _calculate_corner_value(self, board: Board, player: int) -> int:
         """Calculate corner control value"""
-        size = board.size
-        corners = [(0, 0), (0, size - 1), (size - 1, 0), (size - 1, size - 1)]
-        value = 0
-
-        for row, col in corners:
-            if board.grid[row][col] == player:
-                value += 1
-
-        return value
+        corners, _ = _region_masks(board.size)
+        return popcount(board.bitboard(player) & corners)
 
     def _calculate_edge_value(self, board: Board, player: int) -> int:
         """Calculate edge control value (excluding corners)"""
-        size = board.size
-        value = 0
-
-        # Top and bottom edges
-        for col in range(1, size - 1):
-            if board.grid[0][col] == player:
-                value += 1
-            if board.grid[size - 1][col] == player:
-                value += 1
-
-        # Left and right edges
-        for row in range(1, size - 1):
-            if board.grid[row][0] == player:
-                value += 1
-            if board.grid[row][size - 1] == player:
-                value += 1
-
-        return value
-
-    def _copy_board(self, board: Board) -> Board:
-        """Create a copy of the board"""
-        new_board = Board()
-        new_board.grid = [row[:] for row in board.grid]
-        new_board.current_player = board.current_player
-        new_board.game_over = board.game_over
-        new_board.winner = board.winner
-        return new_board
+        _, edges = _region_masks(board.size)
+        return popcount(board.bitboard(player) & edges)
@@ -2,145 +2,485 @@
 Board logic for Reversi/Othello game
 """
 
-from typing import List, Tuple
+import random
+from typing import Dict, Iterator, List, Optional, Tuple
 from config import EMPTY, PLAYER_BLACK, PLAYER_WHITE, DEFAULT_BOARD_SIZE
 
+# All 8 directions as (row delta, column delta)
+DIRECTIONS = [
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+]
+
+try:
+    popcount = int.bit_count  # Python 3.10+
+except AttributeError:
+
+    def popcount(bits: int) -> int:
+        """Count the set bits in a bitboard"""
+        return bin(bits).count("1")
+
+
+# Per board size: list of (bit shift, source mask) pairs, one per direction
+_SHIFT_CACHE: Dict[int, List[Tuple[int, int]]] = {}
+
+
+def _direction_shifts(size: int) -> List[Tuple[int, int]]:
+    """Get the bit shift and source mask for each direction on a board size.
+
+    Square (row, col) maps to bit ``row * size + col``. Moving one step in a
+    direction is a shift by ``dr * size + dc``; the source mask drops the
+    squares on the edge column that would otherwise wrap to the next row.
+    """
+    shifts = _SHIFT_CACHE.get(size)
+    if shifts is None:
+        full = (1 << (size * size)) - 1
+        first_col = sum(1 << (row * size) for row in range(size))
+        last_col = first_col << (size - 1)
+        shifts = []
+        for dr, dc in DIRECTIONS:
+            mask = full
+            if dc == 1:
+                mask &= ~last_col
+            elif dc == -1:
+                mask &= ~first_col
+            shifts.append((dr * size + dc, mask))
+        _SHIFT_CACHE[size] = shifts
+    return shifts
+
+
+def dilate(bits: int, size: int) -> int:
+    """Bitboard of squares one step, in any direction, from a set bit"""
+    result = 0
+    for shift, mask in _direction_shifts(size):
+        if shift > 0:
+            result |= (bits & mask) << shift
+        else:
+            result |= (bits & mask) >> -shift
+    return result & ((1 << (size * size)) - 1)
+
+
+# Per board size: for each square, the mask of its (up to 8) neighbours
+_NEIGHBOUR_CACHE: Dict[int, List[int]] = {}
+
+
+def _neighbour_masks(size: int) -> List[int]:
+    """Get the neighbour mask of every square on a board size"""
+    masks = _NEIGHBOUR_CACHE.get(size)
+    if masks is None:
+        masks = [dilate(1 << index, size) for index in range(size * size)]
+        _NEIGHBOUR_CACHE[size] = masks
+    return masks
+
+
+def _legal_mask_8x8(own: int, opponent: int) -> int:
+    """Legal move mask for the standard 8x8 board, with every fill unrolled.
+
+    Same result as Board._legal_mask, with the masks and shifts for size 8
+    written out. Opponent pieces on the side columns can never be flanked
+    horizontally or diagonally, so those fills use ``inner``, which also
+    stops bits wrapping from one row to the next.
+    """
+    empty = ~(own | opponent) & 0xFFFFFFFFFFFFFFFF
+    inner = opponent & 0x7E7E7E7E7E7E7E7E
+    moves = 0
+
+    # North-west
+    x = (own >> 9) & inner
+    x |= (x >> 9) & inner
+    x |= (x >> 9) & inner
+    x |= (x >> 9) & inner
+    x |= (x >> 9) & inner
+    x |= (x >> 9) & inner
+    moves |= (x >> 9) & empty
+
+    # North
+    x = (own >> 8) & opponent
+    x |= (x >> 8) & opponent
+    x |= (x >> 8) & opponent
+    x |= (x >> 8) & opponent
+    x |= (x >> 8) & opponent
+    x |= (x >> 8) & opponent
+    moves |= (x >> 8) & empty
+
+    # North-east
+    x = (own >> 7) & inner
+    x |= (x >> 7) & inner
+    x |= (x >> 7) & inner
+    x |= (x >> 7) & inner
+    x |= (x >> 7) & inner
+    x |= (x >> 7) & inner
+    moves |= (x >> 7) & empty
+
+    # West
+    x = (own >> 1) & inner
+    x |= (x >> 1) & inner
+    x |= (x >> 1) & inner
+    x |= (x >> 1) & inner
+    x |= (x >> 1) & inner
+    x |= (x >> 1) & inner
+    moves |= (x >> 1) & empty
+
+    # East
+    x = (own << 1) & inner
+    x |= (x << 1) & inner
+    x |= (x << 1) & inner
+    x |= (x << 1) & inner
+    x |= (x << 1) & inner
+    x |= (x << 1) & inner
+    moves |= (x << 1) & empty
+
+    # South-west
+    x = (own << 7) & inner
+    x |= (x << 7) & inner
+    x |= (x << 7) & inner
+    x |= (x << 7) & inner
+    x |= (x << 7) & inner
+    x |= (x << 7) & inner
+    moves |= (x << 7) & empty
+
+    # South
+    x = (own << 8) & opponent
+    x |= (x << 8) & opponent
+    x |= (x << 8) & opponent
+    x |= (x << 8) & opponent
+    x |= (x << 8) & opponent
+    x |= (x << 8) & opponent
+    moves |= (x << 8) & empty
+
+    # South-east
+    x = (own << 9) & inner
+    x |= (x << 9) & inner
+    x |= (x << 9) & inner
+    x |= (x << 9) & inner
+    x |= (x << 9) & inner
+    x |= (x << 9) & inner
+    moves |= (x << 9) & empty
+
+    return moves
+
+
+# Per board size: for each square, the rays of single-bit masks walking
+# away from it in each direction, nearest square first
+_RAY_CACHE: Dict[int, List[Tuple[Tuple[int, ...], ...]]] = {}
+
+
+def _square_rays(size: int) -> List[Tuple[Tuple[int, ...], ...]]:
+    """Get the direction rays for every square on a board size.
+
+    Rays shorter than two squares are left out, since a move needs at least
+    one opponent piece and one of its own to flip anything.
+    """
+    rays = _RAY_CACHE.get(size)
+    if rays is None:
+        rays = []
+        for row in range(size):
+            for col in range(size):
+                square_rays = []
+                for dr, dc in DIRECTIONS:
+                    ray = []
+                    r, c = row + dr, col + dc
+                    while 0 <= r < size and 0 <= c < size:
+                        ray.append(1 << (r * size + c))
+                        r += dr
+                        c += dc
+                    if len(ray) >= 2:
+                        square_rays.append(tuple(ray))
+                rays.append(tuple(square_rays))
+        _RAY_CACHE[size] = rays
+    return rays
+
+
+# Zobrist key mixed in when white is to move
+ZOBRIST_WHITE_TO_MOVE = random.Random(0).getrandbits(64)
+
+# Per board size: (black keys, white keys), one random 64-bit key per square
+_ZOBRIST_CACHE: Dict[int, Tuple[List[int], List[int]]] = {}
+
+
+def _zobrist_keys(size: int) -> Tuple[List[int], List[int]]:
+    """Get the per-square Zobrist keys for black and white on a board size"""
+    keys = _ZOBRIST_CACHE.get(size)
+    if keys is None:
+        # Seeded so keys are the same from run to run
+        rng = random.Random(size)
+        squares = size * size
+        keys = (
+            [rng.getrandbits(64) for _ in range(squares)],
+            [rng.getrandbits(64) for _ in range(squares)],
+        )
+        _ZOBRIST_CACHE[size] = keys
+    return keys
+
+
+# Board state saved by Board.snapshot/apply:
+# (black, white, zkey, current player, game over, winner)
+UndoInfo = Tuple[int, int, int, int, bool, Optional[int]]
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """Yield the index of each set bit, lowest first"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
 
 class Board:
-    """Reversi game board"""
+    """Reversi game board
+
+    The position is stored as two bitboards, ``black`` and ``white``, with
+    square (row, col) at bit ``row * size + col``. ``grid`` unpacks them into
+    a list of rows for code that wants per-cell access.
+
+    ``zkey`` is the Zobrist hash of the pieces, updated incrementally as
+    moves are made; ``hash_key`` adds the side to move.
+    """
 
     def __init__(self, size: int = DEFAULT_BOARD_SIZE):
         self.size = size
-        self.grid = [[EMPTY for _ in range(size)] for _ in range(size)]
+        self.black = 0
+        self.white = 0
+        self.zkey = 0
         self.current_player = PLAYER_BLACK
         self.game_over = False
         self.winner = None
+        # Per player: (black, white, legal move mask) for the last position
+        # its moves were generated for; a changed bitboard means a miss
+        self._moves_cache: Dict[int, Tuple[int, int, int]] = {}
         self.reset()
 
+    @property
+    def grid(self) -> List[List[int]]:
+        """Board contents as a fresh list of rows"""
+        size = self.size
+        black, white = self.black, self.white
+        grid = []
+        for row in range(size):
+            cells = []
+            for col in range(size):
+                bit = 1 << (row * size + col)
+                if black & bit:
+                    cells.append(PLAYER_BLACK)
+                elif white & bit:
+                    cells.append(PLAYER_WHITE)
+                else:
+                    cells.append(EMPTY)
+            grid.append(cells)
+        return grid
+
+    @grid.setter
+    def grid(self, grid: List[List[int]]):
+        """Load board contents from a list of rows"""
+        size = self.size
+        black = white = 0
+        for row in range(size):
+            for col in range(size):
+                if grid[row][col] == PLAYER_BLACK:
+                    black |= 1 << (row * size + col)
+                elif grid[row][col] == PLAYER_WHITE:
+                    white |= 1 << (row * size + col)
+        self.black = black
+        self.white = white
+        self.zkey = self._compute_zkey()
+
     def reset(self):
         """Reset the board to initial state"""
-        self.grid = [[EMPTY for _ in range(self.size)] for _ in range(self.size)]
         # Place initial pieces
-        center = self.size // 2
-        self.grid[center - 1][center - 1] = PLAYER_WHITE
-        self.grid[center - 1][center] = PLAYER_BLACK
-        self.grid[center][center - 1] = PLAYER_BLACK
-        self.grid[center][center] = PLAYER_WHITE
+        size = self.size
+        center = size // 2
+        self.black = (1 << ((center - 1) * size + center)) | (
+            1 << (center * size + center - 1)
+        )
+        self.white = (1 << ((center - 1) * size + center - 1)) | (
+            1 << (center * size + center)
+        )
+        self.zkey = self._compute_zkey()
         self.current_player = PLAYER_BLACK
         self.game_over = False
         self.winner = None
 
+    def _compute_zkey(self) -> int:
+        """Compute the Zobrist hash of the pieces from scratch"""
+        black_keys, white_keys = _zobrist_keys(self.size)
+        zkey = 0
+        for index in iter_bits(self.black):
+            zkey ^= black_keys[index]
+        for index in iter_bits(self.white):
+            zkey ^= white_keys[index]
+        return zkey
+
+    def hash_key(self) -> int:
+        """Zobrist hash of the position, including the side to move"""
+        if self.current_player == PLAYER_WHITE:
+            return self.zkey ^ ZOBRIST_WHITE_TO_MOVE
+        return self.zkey
+
+    def bitboard(self, player: int) -> int:
+        """Get the bitboard of a player's pieces"""
+        return self.black if player == PLAYER_BLACK else self.white
+
+    def _pieces(self, player: int) -> Tuple[int, int]:
+        """Get (own, opponent) bitboards for a player"""
+        if player == PLAYER_BLACK:
+            return self.black, self.white
+        return self.white, self.black
+
+    def _flips(self, index: int, own: int, opponent: int) -> int:
+        """Bitboard of pieces flipped by placing a piece on a square"""
+        flips = 0
+        for ray in _square_rays(self.size)[index]:
+            line = 0
+            for bit in ray:
+                if bit & opponent:
+                    line |= bit
+                else:
+                    if bit & own:
+                        flips |= line
+                    break
+        return flips
+
+    def _legal_mask(self, own: int, opponent: int) -> int:
+        """Bitboard of empty squares where a move flips at least one piece"""
+        size = self.size
+        if size == 8:
+            return _legal_mask_8x8(own, opponent)
+
+        empty = ~(own | opponent) & ((1 << (size * size)) - 1)
+        moves = 0
+        for shift, mask in _direction_shifts(size):
+            if shift > 0:
+                x = ((own & mask) << shift) & opponent
+                for _ in range(size - 3):
+                    x |= ((x & mask) << shift) & opponent
+                moves |= ((x & mask) << shift) & empty
+            else:
+                shift = -shift
+                x = ((own & mask) >> shift) & opponent
+                for _ in range(size - 3):
+                    x |= ((x & mask) >> shift) & opponent
+                moves |= ((x & mask) >> shift) & empty
+        return moves
+
     def is_valid_move(self, row: int, col: int, player: int) -> bool:
         """Check if a move is valid"""
-        if self.grid[row][col] != EMPTY:
+        index = row * self.size + col
+        if (self.black | self.white) & (1 << index):
             return False
 
-        # Check all 8 directions
-        directions = [
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, -1),
-            (0, 1),
-            (1, -1),
-            (1, 0),
-            (1, 1),
-        ]
-
-        for dr, dc in directions:
-            if self._would_flip(row, col, dr, dc, player):
-                return True
-
-        return False
+        # A move must sit next to at least one opponent piece
+        own, opponent = self._pieces(player)
+        if not _neighbour_masks(self.size)[index] & opponent:
+            return False
+        return self._flips(index, own, opponent) != 0
 
-    def _would_flip(self, row: int, col: int, dr: int, dc: int, player: int) -> bool:
-        """Check if pieces would be flipped in a direction"""
-        r, c = row + dr, col + dc
-        opponent = 3 - player  # Switch player
-        found_opponent = False
-
-        while 0 <= r < self.size and 0 <= c < self.size:
-            if self.grid[r][c] == EMPTY:
-                return False
-            if self.grid[r][c] == opponent:
-                found_opponent = True
-            elif self.grid[r][c] == player:
-                return found_opponent
-            r += dr
-            c += dc
+    def _moves_mask(self, player: int) -> int:
+        """Bitboard of a player's legal moves, reused while the board is unchanged"""
+        black, white = self.black, self.white
+        cached = self._moves_cache.get(player)
+        if cached is not None and cached[0] == black and cached[1] == white:
+            return cached[2]
 
-        return False
+        own, opponent = self._pieces(player)
+        moves = self._legal_mask(own, opponent)
+        self._moves_cache[player] = (black, white, moves)
+        return moves
 
     def get_valid_moves(self, player: int) -> List[Tuple[int, int]]:
         """Get all valid moves for a player"""
-        moves = []
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.is_valid_move(row, col, player):
-                    moves.append((row, col))
-        return moves
+        size = self.size
+        return [divmod(index, size) for index in iter_bits(self._moves_mask(player))]
 
-    def make_move(self, row: int, col: int, player: int) -> List[Tuple[int, int]]:
-        """Make a move and return flipped pieces"""
-        if not self.is_valid_move(row, col, player):
-            return []
+    def _play(self, index: int, player: int) -> int:
+        """Place a piece on a square and return the flipped bitboard.
+
+        Nothing changes, and 0 is returned, if the move is not legal. The
+        side to move is left as it is.
+        """
+        bit = 1 << index
+        if (self.black | self.white) & bit:
+            return 0
 
-        self.grid[row][col] = player
-        flipped = []
+        own, opponent = self._pieces(player)
+        flips = self._flips(index, own, opponent)
+        if not flips:
+            return 0
 
-        # Check all directions and flip pieces
-        directions = [
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, -1),
-            (0, 1),
-            (1, -1),
-            (1, 0),
-            (1, 1),
-        ]
+        own |= bit | flips
+        opponent &= ~flips
+        black_keys, white_keys = _zobrist_keys(self.size)
+        if player == PLAYER_BLACK:
+            self.black, self.white = own, opponent
+            zkey = self.zkey ^ black_keys[index]
+        else:
+            self.white, self.black = own, opponent
+            zkey = self.zkey ^ white_keys[index]
 
-        for dr, dc in directions:
-            flipped.extend(self._flip_direction(row, col, dr, dc, player))
+        for flipped in iter_bits(flips):
+            zkey ^= black_keys[flipped] ^ white_keys[flipped]
+        self.zkey = zkey
+
+        return flips
+
+    def count_valid_moves(self, player: int) -> int:
+        """Count the valid moves for a player without listing them"""
+        return popcount(self._moves_mask(player))
+
+    def make_move(self, row: int, col: int, player: int) -> List[Tuple[int, int]]:
+        """Make a move and return flipped pieces"""
+        flips = self._play(row * self.size + col, player)
+        if not flips:
+            return []
 
         # Switch to the other player
         self.switch_player()
 
-        return flipped
-
-    def _flip_direction(
-        self, row: int, col: int, dr: int, dc: int, player: int
-    ) -> List[Tuple[int, int]]:
-        """Flip pieces in a direction"""
-        r, c = row + dr, col + dc
-        opponent = 3 - player
-        to_flip = []
-
-        while 0 <= r < self.size and 0 <= c < self.size:
-            if self.grid[r][c] == opponent:
-                to_flip.append((r, c))
-            elif self.grid[r][c] == player:
-                # Flip all pieces in between
-                for fr, fc in to_flip:
-                    self.grid[fr][fc] = player
-                return to_flip
-            else:
-                break
-            r += dr
-            c += dc
+        size = self.size
+        return [divmod(index, size) for index in iter_bits(flips)]
+
+    def snapshot(self) -> UndoInfo:
+        """Capture the board state so it can be restored with revert"""
+        return (
+            self.black,
+            self.white,
+            self.zkey,
+            self.current_player,
+            self.game_over,
+            self.winner,
+        )
+
+    def apply(self, row: int, col: int, player: int) -> UndoInfo:
+        """Make a move in place, returning the state needed to revert it"""
+        undo = self.snapshot()
+        if self._play(row * self.size + col, player):
+            self.switch_player()
+        return undo
 
-        return []
+    def revert(self, undo: UndoInfo):
+        """Restore the board state captured by snapshot or apply"""
+        (
+            self.black,
+            self.white,
+            self.zkey,
+            self.current_player,
+            self.game_over,
+            self.winner,
+        ) = undo
 
     def get_score(self) -> Tuple[int, int]:
         """Get current score (black, white)"""
-        black = sum(row.count(PLAYER_BLACK) for row in self.grid)
-        white = sum(row.count(PLAYER_WHITE) for row in self.grid)
-        return black, white
+        return popcount(self.black), popcount(self.white)
 
     def check_game_over(self):
         """Check if game is over"""
-        black_moves = self.get_valid_moves(PLAYER_BLACK)
-        white_moves = self.get_valid_moves(PLAYER_WHITE)
+        black_moves = self.count_valid_moves(PLAYER_BLACK)
+        white_moves = self.count_valid_moves(PLAYER_WHITE)
 
         if not black_moves and not white_moves:
             self.game_over = True
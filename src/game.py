@@ -6,7 +6,7 @@ import pygame as pg
 import sys
 import math
 import json
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 from board import Board
 from ai import AI
 from config import *
@@ -15,6 +15,23 @@ from config import *
 class Game:
     """Main game class"""
 
+    # Lines of the key help panel, one every 25 pixels
+    INSTRUCTIONS = (
+        "Click to place pieces",
+        "R: Reset game",
+        "H: Toggle hints",
+        "U: Undo move",
+        "Y: Redo move",
+        "S: Save game",
+        "L: Load game",
+        "ESC: Quit",
+    )
+
+    # Status line text while playing (by player to move) and once the game
+    # is over (by winner; anything else is a draw)
+    TURN_TEXT = {PLAYER_BLACK: "Black's turn", PLAYER_WHITE: "White's turn"}
+    WINNER_TEXT = {PLAYER_BLACK: "Black wins!", PLAYER_WHITE: "White wins!"}
+
     def __init__(self):
         pg.init()
         self.board_size = DEFAULT_BOARD_SIZE
@@ -32,6 +49,17 @@ class Game:
         self.clock = pg.time.Clock()
         self.font = pg.font.Font(None, 36)
         self.small_font = pg.font.Font(None, 24)
+        # Rendered text surfaces by (font, text, color); UI text repeats
+        # across frames, so each string is only rasterized once
+        self._text_cache: Dict[Tuple[pg.font.Font, str, Tuple], pg.Surface] = {}
+        self._instructions_surface: Optional[pg.Surface] = None
+        # Checkerboard background with grid lines by board size
+        self._board_surfaces: Dict[int, pg.Surface] = {}
+        # Piece surfaces by (color, radius, outlined)
+        self._piece_surfaces: Dict[Tuple[Tuple, int, bool], pg.Surface] = {}
+        # Valid move markers for the position in _moves_overlay_key
+        self._moves_overlay: Optional[pg.Surface] = None
+        self._moves_overlay_key: Optional[Tuple[int, int, int]] = None
 
         # Initialize sound system
         pg.mixer.init()
@@ -48,17 +76,22 @@ class Game:
         # Game state
         self.game_started = False
         self.selected_square = None
+        # Set whenever the frame may have changed; cleared by draw()
+        self.needs_redraw = True
 
         # Animation state
         self.animations = []  # List of active animations
+        # First active animation on each square, for per-piece lookups
+        self.square_animations: Dict[Tuple[int, int], Animation] = {}
         self.animation_speed = ANIMATION_SPEED
 
         # Move history for undo/redo
-        self.move_history = []  # Stack of game states
+        self.move_history = []  # Stack of board snapshots
         self.redo_stack = []  # Stack for redo functionality
 
         # Statistics tracking
         self.stats = self._load_stats()
+        self._saved_stats_json = self._serialize_stats()
         self.current_game_moves = 0
 
     def _load_sounds(self):
@@ -71,74 +104,53 @@ class Game:
             "draw": self._create_draw_sound(),
         }
 
-    def _create_move_sound(self) -> pg.mixer.Sound:
-        """Create a simple move sound effect"""
-        # Create a short beep sound
+    def _create_tone(
+        self,
+        duration: float,
+        start_freq: float,
+        end_freq: float,
+        amplitude: int,
+        volume: float,
+    ) -> pg.mixer.Sound:
+        """Create an 8-bit sine tone, sweeping linearly between two frequencies"""
         sample_rate = 44100
-        duration = 0.1  # 100ms
-        frequency = 800  # Hz
-
         samples = int(sample_rate * duration)
-        buffer = bytearray()
-
-        for i in range(samples):
-            # Generate sine wave
-            sample = int(127 + 50 * math.sin(2 * math.pi * frequency * i / sample_rate))
-            buffer.append(sample)
+        sweep = end_freq - start_freq
+        two_pi = 2 * math.pi
+        sin = math.sin
+
+        buffer = bytes(
+            int(
+                127
+                + amplitude
+                * sin(two_pi * (start_freq + (i / samples) * sweep) * i / sample_rate)
+            )
+            for i in range(samples)
+        )
 
-        sound = pg.mixer.Sound(buffer=bytes(buffer))
-        sound.set_volume(0.3)
+        sound = pg.mixer.Sound(buffer=buffer)
+        sound.set_volume(volume)
         return sound
 
+    def _create_move_sound(self) -> pg.mixer.Sound:
+        """Create a simple move sound effect"""
+        # Short 800 Hz beep
+        return self._create_tone(0.1, 800, 800, 50, 0.3)
+
     def _create_win_sound(self) -> pg.mixer.Sound:
         """Create a victory sound effect"""
-        sample_rate = 44100
-        duration = 0.5
-        buffer = bytearray()
-
-        samples = int(sample_rate * duration)
-        for i in range(samples):
-            # Ascending tone
-            freq = 400 + (i / samples) * 400
-            sample = int(127 + 60 * math.sin(2 * math.pi * freq * i / sample_rate))
-            buffer.append(sample)
-
-        sound = pg.mixer.Sound(buffer=bytes(buffer))
-        sound.set_volume(0.4)
-        return sound
+        # Ascending tone
+        return self._create_tone(0.5, 400, 800, 60, 0.4)
 
     def _create_lose_sound(self) -> pg.mixer.Sound:
         """Create a defeat sound effect"""
-        sample_rate = 44100
-        duration = 0.5
-        buffer = bytearray()
-
-        samples = int(sample_rate * duration)
-        for i in range(samples):
-            # Descending tone
-            freq = 600 - (i / samples) * 300
-            sample = int(127 + 40 * math.sin(2 * math.pi * freq * i / sample_rate))
-            buffer.append(sample)
-
-        sound = pg.mixer.Sound(buffer=bytes(buffer))
-        sound.set_volume(0.3)
-        return sound
+        # Descending tone
+        return self._create_tone(0.5, 600, 300, 40, 0.3)
 
     def _create_draw_sound(self) -> pg.mixer.Sound:
         """Create a draw sound effect"""
-        sample_rate = 44100
-        duration = 0.3
-        buffer = bytearray()
-
-        samples = int(sample_rate * duration)
-        for i in range(samples):
-            # Neutral tone
-            sample = int(127 + 30 * math.sin(2 * math.pi * 500 * i / sample_rate))
-            buffer.append(sample)
-
-        sound = pg.mixer.Sound(buffer=bytes(buffer))
-        sound.set_volume(0.2)
-        return sound
+        # Neutral tone
+        return self._create_tone(0.3, 500, 500, 30, 0.2)
 
     def play_sound(self, sound_name: str):
         """Play a sound effect if sound is enabled"""
@@ -157,11 +169,19 @@ class Game:
         except (FileNotFoundError, json.JSONDecodeError, KeyError):
             return GameStats()
 
+    def _serialize_stats(self) -> str:
+        """Serialize statistics the way they are written to file"""
+        return json.dumps(asdict(self.stats), indent=2)
+
     def _save_stats(self):
-        """Save statistics to file"""
+        """Save statistics to file, skipping the write if nothing changed"""
         try:
+            data = self._serialize_stats()
+            if data == self._saved_stats_json:
+                return
             with open("stats.json", "w", encoding="utf-8") as f:
-                json.dump(asdict(self.stats), f, indent=2)
+                f.write(data)
+            self._saved_stats_json = data
         except (OSError, TypeError):
             pass  # Silently fail
 
@@ -198,30 +218,34 @@ class Game:
             anim_type=anim_type,
         )
         self.animations.append(animation)
+        self.square_animations.setdefault((row, col), animation)
 
     def update_animations(self):
         """Update active animations"""
+        if not self.animations:
+            return
+
+        # Redraw while animating, including the frame after the last one ends
+        self.needs_redraw = True
         current_time = pg.time.get_ticks() / 1000.0
-        # Remove completed animations
-        self.animations = [
-            anim
-            for anim in self.animations
-            if current_time - anim.start_time < anim.duration
-        ]
+        # Remove completed animations and re-index the rest in one pass
+        animations = []
+        square_animations: Dict[Tuple[int, int], Animation] = {}
+        for anim in self.animations:
+            if current_time - anim.start_time < anim.duration:
+                animations.append(anim)
+                square_animations.setdefault((anim.row, anim.col), anim)
+        self.animations = animations
+        self.square_animations = square_animations
+
+    def clear_animations(self):
+        """Stop all active animations"""
+        self.animations.clear()
+        self.square_animations.clear()
 
     def save_game_state(self):
         """Save current game state for undo functionality"""
-        state = GameState(
-            board_grid=[row[:] for row in self.board.grid],
-            current_player=self.board.current_player,
-            move_history=[],  # We'll handle this separately
-            black_score=self.board.get_score()[0],
-            white_score=self.board.get_score()[1],
-            game_over=self.board.game_over,
-            winner=self.board.winner,
-            settings={},
-        )
-        self.move_history.append(state)
+        self.move_history.append(self.board.snapshot())
         # Clear redo stack when new move is made
         self.redo_stack.clear()
 
@@ -229,66 +253,38 @@ class Game:
         """Undo the last move"""
         if self.move_history:
             # Save current state to redo stack
-            current_state = GameState(
-                board_grid=[row[:] for row in self.board.grid],
-                current_player=self.board.current_player,
-                move_history=[],
-                black_score=self.board.get_score()[0],
-                white_score=self.board.get_score()[1],
-                game_over=self.board.game_over,
-                winner=self.board.winner,
-                settings={},
-            )
-            self.redo_stack.append(current_state)
+            self.redo_stack.append(self.board.snapshot())
 
             # Restore previous state
-            prev_state = self.move_history.pop()
-            self.board.grid = [row[:] for row in prev_state.board_grid]
-            self.board.current_player = prev_state.current_player
-            self.board.game_over = prev_state.game_over
-            self.board.winner = prev_state.winner
+            self.board.revert(self.move_history.pop())
 
             # Clear animations
-            self.animations.clear()
+            self.clear_animations()
 
     def redo_move(self):
         """Redo the last undone move"""
         if self.redo_stack:
             # Save current state to history
-            current_state = GameState(
-                board_grid=[row[:] for row in self.board.grid],
-                current_player=self.board.current_player,
-                move_history=[],
-                black_score=self.board.get_score()[0],
-                white_score=self.board.get_score()[1],
-                game_over=self.board.game_over,
-                winner=self.board.winner,
-                settings={},
-            )
-            self.move_history.append(current_state)
+            self.move_history.append(self.board.snapshot())
 
             # Restore redo state
-            redo_state = self.redo_stack.pop()
-            self.board.grid = [row[:] for row in redo_state.board_grid]
-            self.board.current_player = redo_state.current_player
-            self.board.game_over = redo_state.game_over
-            self.board.winner = redo_state.winner
+            self.board.revert(self.redo_stack.pop())
 
             # Clear animations
-            self.animations.clear()
+            self.clear_animations()
 
     def save_game(self, filename: str = "saved_game.json"):
         """Save current game state to file"""
         try:
-            game_state = GameState(
-                board_grid=self.board.grid,
-                current_player=self.board.current_player,
-                move_history=[],  # Could be extended to save full history
-                black_score=self.board.get_score()[0],
-                white_score=self.board.get_score()[1],
-                game_over=self.board.game_over,
-                winner=self.board.winner,
-                settings={
+            black_score, white_score = self.board.get_score()
+            state_dict = {
+                "board_grid": self.board.grid,
+                "current_player": self.board.current_player,
+                "black_score": black_score,
+                "white_score": white_score,
+                "game_over": self.board.game_over,
+                "winner": self.board.winner,
+                "settings": {
                     "theme": "Classic",  # Could be extended
                     "sound_enabled": True,
                     "show_hints": self.show_valid_moves,
@@ -296,17 +292,6 @@ class Game:
                     "board_size": self.board_size,
                     "player_color": self.player_color,
                 },
-            )
-
-            # Convert to dictionary for JSON serialization
-            state_dict = {
-                "board_grid": game_state.board_grid,
-                "current_player": game_state.current_player,
-                "black_score": game_state.black_score,
-                "white_score": game_state.white_score,
-                "game_over": game_state.game_over,
-                "winner": game_state.winner,
-                "settings": game_state.settings,
                 "timestamp": pg.time.get_ticks() / 1000.0,
             }
 
@@ -339,7 +324,7 @@ class Game:
             # Clear history and animations
             self.move_history.clear()
             self.redo_stack.clear()
-            self.animations.clear()
+            self.clear_animations()
 
             return True
         except Exception:
@@ -347,22 +332,22 @@ class Game:
 
     def get_animation_scale(self, row: int, col: int) -> float:
         """Get the current scale for an animated piece"""
-        for anim in self.animations:
-            if anim.row == row and anim.col == col:
-                current_time = pg.time.get_ticks() / 1000.0
-                progress = (current_time - anim.start_time) / anim.duration
-                progress = min(max(progress, 0.0), 1.0)  # Clamp to [0, 1]
-
-                if anim.anim_type == "place":
-                    # Smooth scale in
-                    scale_diff = anim.end_scale - anim.start_scale
-                    return anim.start_scale + scale_diff * progress
-                elif anim.anim_type == "flip":
-                    # Pulse effect for flipping
-                    if progress < 0.5:
-                        return 1.0 - progress * 0.3
-                    else:
-                        return 0.85 + (progress - 0.5) * 0.3
+        anim = self.square_animations.get((row, col))
+        if anim is not None:
+            current_time = pg.time.get_ticks() / 1000.0
+            progress = (current_time - anim.start_time) / anim.duration
+            progress = min(max(progress, 0.0), 1.0)  # Clamp to [0, 1]
+
+            if anim.anim_type == "place":
+                # Smooth scale in
+                scale_diff = anim.end_scale - anim.start_scale
+                return anim.start_scale + scale_diff * progress
+            elif anim.anim_type == "flip":
+                # Pulse effect for flipping
+                if progress < 0.5:
+                    return 1.0 - progress * 0.3
+                else:
+                    return 0.85 + (progress - 0.5) * 0.3
         return 1.0  # No animation
 
     def run(self):
@@ -371,7 +356,8 @@ class Game:
         while running:
             self.handle_events()
             self.update()
-            self.draw()
+            if self.needs_redraw:
+                self.draw()
             self.clock.tick(60)
 
         pg.quit()
@@ -380,6 +366,8 @@ class Game:
     def handle_events(self):
         """Handle user input"""
         for event in pg.event.get():
+            # Input or window events may change what is on screen
+            self.needs_redraw = True
             if event.type == pg.QUIT:
                 pg.quit()
                 sys.exit()
@@ -414,7 +402,7 @@ class Game:
             self.board.reset()
             self.move_history.clear()
             self.redo_stack.clear()
-            self.animations.clear()
+            self.clear_animations()
             self.game_started = False
             self.current_game_moves = 0
         elif key == pg.K_h:  # Toggle hints
@@ -492,6 +480,7 @@ class Game:
                         self.play_sound("draw")
 
             self.ai_thinking = False
+            self.needs_redraw = True
 
     def draw(self):
         """Draw everything"""
@@ -511,26 +500,36 @@ class Game:
         self.draw_ui()
 
         pg.display.flip()
+        self.needs_redraw = False
+
+    def _get_board_surface(self) -> pg.Surface:
+        """Get the checkerboard and grid for the board size, drawing it once"""
+        surface = self._board_surfaces.get(self.board_size)
+        if surface is None:
+            extent = self.board_size * CELL_SIZE
+            surface = pg.Surface((extent, extent))
+            for row in range(self.board_size):
+                for col in range(self.board_size):
+                    # Alternate colors for checkerboard pattern
+                    color = LIGHT_GRAY if (row + col) % 2 == 0 else DARK_GREEN
+                    rect = (col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+                    pg.draw.rect(surface, color, rect)
+
+                    # Draw grid lines
+                    pg.draw.rect(surface, BLACK, rect, 1)
+            self._board_surfaces[self.board_size] = surface
+        return surface
 
     def draw_board(self):
         """Draw the game board"""
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                x = MARGIN + col * CELL_SIZE
-                y = MARGIN + row * CELL_SIZE
-
-                # Alternate colors for checkerboard pattern
-                color = LIGHT_GRAY if (row + col) % 2 == 0 else DARK_GREEN
-                pg.draw.rect(self.screen, color, (x, y, CELL_SIZE, CELL_SIZE))
-
-                # Draw grid lines
-                pg.draw.rect(self.screen, BLACK, (x, y, CELL_SIZE, CELL_SIZE), 1)
+        self.screen.blit(self._get_board_surface(), (MARGIN, MARGIN))
 
     def draw_pieces(self):
         """Draw game pieces"""
+        grid = self.board.grid
         for row in range(self.board_size):
             for col in range(self.board_size):
-                piece = self.board.grid[row][col]
+                piece = grid[row][col]
                 if piece != EMPTY:
                     x = MARGIN + col * CELL_SIZE + CELL_SIZE // 2
                     y = MARGIN + row * CELL_SIZE + CELL_SIZE // 2
@@ -540,21 +539,74 @@ class Game:
                     radius = int((CELL_SIZE // 2 - 5) * scale)
 
                     color = BLACK if piece == PLAYER_BLACK else WHITE
-                    pg.draw.circle(self.screen, color, (x, y), radius)
-                    if scale > 0.8:  # Only draw outline when piece is mostly formed
-                        outline_radius = max(1, int(radius * 0.9))
-                        pg.draw.circle(self.screen, BLACK, (x, y), outline_radius, 2)
+                    # Only draw outline when piece is mostly formed
+                    surface = self._get_piece_surface(color, radius, scale > 0.8)
+                    offset = radius + 1
+                    self.screen.blit(surface, (x - offset, y - offset))
+
+    def _get_piece_surface(
+        self, color: Tuple, radius: int, outlined: bool
+    ) -> pg.Surface:
+        """Get a piece drawn at a radius, drawing it on first use.
+
+        Animations scale pieces through whole-pixel radii up to the resting
+        size, so the cache holds at most two surfaces per color and radius.
+        """
+        key = (color, radius, outlined)
+        surface = self._piece_surfaces.get(key)
+        if surface is None:
+            # Centered one pixel in from the edge so nothing is clipped
+            center = (radius + 1, radius + 1)
+            surface = pg.Surface((2 * radius + 2, 2 * radius + 2), pg.SRCALPHA)
+            pg.draw.circle(surface, color, center, radius)
+            if outlined:
+                outline_radius = max(1, int(radius * 0.9))
+                pg.draw.circle(surface, BLACK, center, outline_radius, 2)
+            self._piece_surfaces[key] = surface
+        return surface
 
     def draw_valid_moves(self):
         """Draw valid move indicators"""
-        valid_moves = self.board.get_valid_moves(self.board.current_player)
-        for row, col in valid_moves:
-            x = MARGIN + col * CELL_SIZE + CELL_SIZE // 2
-            y = MARGIN + row * CELL_SIZE + CELL_SIZE // 2
-            radius = 8
-
-            pg.draw.circle(self.screen, BLUE, (x, y), radius)
-            pg.draw.circle(self.screen, BLACK, (x, y), radius, 1)
+        board = self.board
+        key = (board.black, board.white, board.current_player)
+        if key != self._moves_overlay_key:
+            # Position changed: draw the markers once onto a board overlay
+            extent = self.board_size * CELL_SIZE
+            overlay = pg.Surface((extent, extent), pg.SRCALPHA)
+            for row, col in board.get_valid_moves(board.current_player):
+                x = col * CELL_SIZE + CELL_SIZE // 2
+                y = row * CELL_SIZE + CELL_SIZE // 2
+                radius = 8
+
+                pg.draw.circle(overlay, BLUE, (x, y), radius)
+                pg.draw.circle(overlay, BLACK, (x, y), radius, 1)
+            self._moves_overlay = overlay
+            self._moves_overlay_key = key
+
+        self.screen.blit(self._moves_overlay, (MARGIN, MARGIN))
+
+    def _render_text(self, font: pg.font.Font, text: str, color: Tuple) -> pg.Surface:
+        """Render antialiased text, reusing the surface from earlier frames"""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+
+    def _get_instructions_surface(self) -> pg.Surface:
+        """Get the instructions panel, rendering it on first use"""
+        if self._instructions_surface is None:
+            lines = [
+                self.small_font.render(text, True, GRAY) for text in self.INSTRUCTIONS
+            ]
+            width = max(line.get_width() for line in lines)
+            height = (len(lines) - 1) * 25 + lines[-1].get_height()
+            panel = pg.Surface((width, height), pg.SRCALPHA)
+            for i, line in enumerate(lines):
+                panel.blit(line, (0, i * 25))
+            self._instructions_surface = panel
+        return self._instructions_surface
 
     def draw_ui(self):
         """Draw user interface"""
@@ -563,45 +615,26 @@ class Game:
         # Score
         black_score, white_score = self.board.get_score()
         score_text = f"Black: {black_score}  White: {white_score}"
-        score_surf = self.font.render(score_text, True, BLACK)
+        score_surf = self._render_text(self.font, score_text, BLACK)
         self.screen.blit(score_surf, (MARGIN, ui_y))
 
         # Current player
-        player_text = (
-            "Black's turn"
-            if self.board.current_player == PLAYER_BLACK
-            else "White's turn"
-        )
         if self.board.game_over:
-            if self.board.winner == PLAYER_BLACK:
-                player_text = "Black wins!"
-            elif self.board.winner == PLAYER_WHITE:
-                player_text = "White wins!"
-            else:
-                player_text = "It's a draw!"
+            player_text = self.WINNER_TEXT.get(self.board.winner, "It's a draw!")
+        else:
+            player_text = self.TURN_TEXT[self.board.current_player]
 
-        player_surf = self.font.render(
-            player_text, True, RED if self.board.game_over else BLACK
+        player_surf = self._render_text(
+            self.font, player_text, RED if self.board.game_over else BLACK
         )
         self.screen.blit(player_surf, (MARGIN, ui_y + 40))
 
         # Instructions
-        instructions = [
-            "Click to place pieces",
-            "R: Reset game",
-            "H: Toggle hints",
-            "U: Undo move",
-            "Y: Redo move",
-            "S: Save game",
-            "L: Load game",
-            "ESC: Quit",
-        ]
-
-        for i, text in enumerate(instructions):
-            instr_surf = self.small_font.render(text, True, GRAY)
-            self.screen.blit(instr_surf, (self.screen_width - 200, ui_y + i * 25))
+        self.screen.blit(
+            self._get_instructions_surface(), (self.screen_width - 200, ui_y)
+        )
 
         # AI thinking indicator
         if self.ai_thinking:
-            thinking_surf = self.small_font.render("AI thinking...", True, RED)
+            thinking_surf = self._render_text(self.small_font, "AI thinking...", RED)
             self.screen.blit(thinking_surf, (MARGIN, ui_y + 70))
@@ -8,7 +8,7 @@ import os
 # Add src to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from ai import AI
+from ai import AI, TT_SIZE, _search_root_move
 from board import Board
 from config import PLAYER_BLACK
 
@@ -68,3 +68,67 @@ def test_ai_no_moves():
     ai = AI()
     move = ai.get_move(board)
     assert move is None  # No moves available
+
+
+def test_ai_search_restores_board():
+    """Test minimax search leaves the board as it found it"""
+    board = Board()
+    board.make_move(2, 3, PLAYER_BLACK)
+    before = board.snapshot()
+
+    ai = AI(difficulty=3)
+    move = ai.get_move(board)
+    assert move is not None
+    assert board.snapshot() == before
+
+
+def test_ai_parallel_root_search():
+    """Test root search in worker processes finds an equally good move"""
+    board = Board()
+    board.make_move(2, 3, PLAYER_BLACK)
+    board.make_move(2, 2, 2)
+
+    serial_move = AI(difficulty=3).get_move(board)
+    parallel_move = AI(difficulty=3, workers=2).get_move(board)
+
+    # Ties may be broken differently, but the scores must match
+    state = board.snapshot()
+    serial_score = _search_root_move((3, 8, state, serial_move, 4))
+    parallel_score = _search_root_move((3, 8, state, parallel_move, 4))
+    assert parallel_score == serial_score
+
+
+def test_ai_time_limit():
+    """Test an exhausted time budget still returns a legal move"""
+    board = Board()
+    ai = AI(difficulty=3, time_limit=0)
+
+    move = ai.get_move(board)
+    assert move is not None
+    assert board.is_valid_move(move[0], move[1], PLAYER_BLACK)
+
+
+def test_ai_transposition_table_bounded():
+    """Test the transposition table stays a fixed size across moves"""
+    board = Board()
+    ai = AI(difficulty=3)
+
+    for _ in range(3):
+        move = ai.get_move(board)
+        board.make_move(move[0], move[1], board.current_player)
+
+    assert len(ai.transposition_table) == TT_SIZE
+    assert ai.tt_age == 3
+    assert any(entry is not None for entry in ai.transposition_table)
+
+
+def test_ai_killer_moves():
+    """Test cutoffs are recorded as at most two killer moves per depth"""
+    board = Board()
+    ai = AI(difficulty=3)
+
+    ai.get_move(board)
+
+    assert ai.killers
+    assert all(len(killers) <= 2 for killers in ai.killers.values())
+    assert ai.history_scores
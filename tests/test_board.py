@@ -8,7 +8,7 @@ import os
 # Add src to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from board import Board
+from board import Board, dilate
 from config import PLAYER_BLACK, PLAYER_WHITE, EMPTY
 
 
@@ -91,3 +91,92 @@ def test_score_calculation():
     black, white = board.get_score()
     assert black == 4  # Placed 1 + flipped 1
     assert white == 1  # Lost 1 piece
+
+
+def test_grid_round_trip():
+    """Test grid unpacks from and loads into the bitboards"""
+    board = Board()
+    board.make_move(2, 3, PLAYER_BLACK)
+    grid = board.grid
+
+    other = Board()
+    other.grid = grid
+    assert other.black == board.black
+    assert other.white == board.white
+    assert other.grid == grid
+
+
+def test_small_board():
+    """Test moves on a non-default board size"""
+    board = Board(6)
+    assert board.grid[2][2] == PLAYER_WHITE
+    assert board.grid[2][3] == PLAYER_BLACK
+
+    valid_moves = board.get_valid_moves(PLAYER_BLACK)
+    assert valid_moves == [(1, 2), (2, 1), (3, 4), (4, 3)]
+
+    # Moves on the last column must not wrap onto the next row
+    flipped = board.make_move(3, 4, PLAYER_BLACK)
+    assert flipped == [(3, 3)]
+    assert board.get_score() == (4, 1)
+
+
+def test_zobrist_key():
+    """Test the incremental Zobrist key matches a full recompute"""
+    board = Board()
+    start_key = board.hash_key()
+
+    board.make_move(2, 3, PLAYER_BLACK)
+    board.make_move(2, 2, PLAYER_WHITE)
+    assert board.zkey == board._compute_zkey()
+    assert board.zkey != Board().zkey
+
+    # Same pieces with a different side to move hash differently
+    key = board.hash_key()
+    board.switch_player()
+    assert board.hash_key() != key
+
+    board.reset()
+    assert board.hash_key() == start_key
+
+
+def test_apply_revert():
+    """Test a move applied in place can be reverted"""
+    board = Board()
+    before = board.snapshot()
+
+    undo = board.apply(2, 3, PLAYER_BLACK)
+    assert board.grid[3][3] == PLAYER_BLACK
+    assert board.current_player == PLAYER_WHITE
+
+    board.revert(undo)
+    assert board.snapshot() == before
+    assert board.grid == Board().grid
+
+
+def test_dilate():
+    """Test dilation stays on the board and does not wrap between rows"""
+    # Corner square (0, 0) has three neighbours
+    assert dilate(1, 8) == (1 << 1) | (1 << 8) | (1 << 9)
+
+    # Square (1, 7) on the right edge must not reach the next row's start
+    assert dilate(1 << 15, 8) == sum(
+        1 << (r * 8 + c) for r, c in [(0, 6), (0, 7), (1, 6), (2, 6), (2, 7)]
+    )
+
+
+def test_valid_moves_follow_board_changes():
+    """Test cached valid moves never outlive the position they came from"""
+    board = Board()
+    start_moves = board.get_valid_moves(PLAYER_BLACK)
+
+    undo = board.apply(2, 3, PLAYER_BLACK)
+    assert board.get_valid_moves(PLAYER_BLACK) != start_moves
+    board.revert(undo)
+    assert board.get_valid_moves(PLAYER_BLACK) == start_moves
+
+    # Loading a grid directly must not reuse the old moves either
+    grid = board.grid
+    grid[3][3] = EMPTY
+    board.grid = grid
+    assert (2, 3) not in board.get_valid_moves(PLAYER_BLACK)